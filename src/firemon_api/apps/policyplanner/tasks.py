@@ -1,4 +1,7 @@
 # Standard packages
+import concurrent.futures as cf
+import copy
+import functools
 import logging
 from typing import Optional
 
@@ -8,7 +11,7 @@ from firemon_api.core.api import FiremonAPI
 from firemon_api.core.endpoint import Endpoint
 from firemon_api.core.response import BaseRecord
 from firemon_api.core.query import Request, RequestResponse
-from firemon_api.core.utils import _find_dicts_with_key
+from firemon_api.core.utils import _find_dicts_with_key, _intern_keys
 
 log = logging.getLogger(__name__)
 
@@ -30,26 +33,26 @@ class Task(BaseRecord):
         template = {}
 
         for response in _find_dicts_with_key("key", self._config):
+            k = response["key"]
             # Get rid of headings that are capitalized
             # hopefully all Json name format is followed
-            if response["key"][0].isupper():
+            if k[:1].isupper():
                 continue
             # apparently we are serializing values `key.subkey` "interestingly".
             #   unsure if this is an Angular thing. Told that max of 1 key deep?
-            key = None
-            sub_key = None
-            k_s = response["key"].split(".", maxsplit=1)
-            if len(k_s) == 1:
-                key = response["key"]
-                template.setdefault(key)
+            # An explicit `"defaultValue": null` still replaces an earlier value
+            dot = k.find(".")
+            if dot < 0:
+                if "defaultValue" in response:
+                    template[k] = response["defaultValue"]
+                else:
+                    template.setdefault(k)
             else:
-                key = k_s[0]
-                sub_key = k_s[1]
-                template.setdefault(key, {}).setdefault(sub_key)
-            if "defaultValue" in response and not sub_key:
-                template[key] = response["defaultValue"]
-            elif "defaultValue" in response:
-                template[key][sub_key] = response["defaultValue"]
+                sub = template.setdefault(k[:dot], {})
+                sub_key = k[dot + 1 :]
+                sub.setdefault(sub_key)
+                if "defaultValue" in response:
+                    sub[sub_key] = response["defaultValue"]
 
         return template
 
@@ -71,12 +74,24 @@ class Tasks(Endpoint):
     def __init__(self, api: FiremonAPI, app: App, record=Task):
         super().__init__(api, app, record=record)
 
+        # Task layouts are static form metadata so keep them per instance
+        self._layout_cached = functools.lru_cache(maxsize=256)(self._layout)
+
     # Override the default to include "name" for our modified Record
     def _response_loader(self, values, name):
         return self.return_obj(values, self.app, name)
 
+    def _load_services(self, services: list[dict]) -> list[Task]:
+        # Many services share a task type, only build each Task once and
+        # fetch the layouts side by side
+        types = list(dict.fromkeys(st["serviceTaskType"] for st in services))
+        with cf.ThreadPoolExecutor(max_workers=4) as pool:
+            layouts = pool.map(self.layout, types)
+            seen = {t: self._response_loader(l, t) for t, l in zip(types, layouts)}
+
+        return [seen[st["serviceTaskType"]] for st in services]
+
     def all(self) -> list[Task]:
-        tasks = []
         key = "service"
         filters = {"includeCannotCreate": True}
 
@@ -87,18 +102,27 @@ class Tasks(Endpoint):
             session=self.session,
         ).get()
 
-        for st in resp:
-            layout = self.layout(st["serviceTaskType"])
-            tasks.append(self._response_loader(layout, st["serviceTaskType"]))
-
-        return tasks
+        return self._load_services(resp)
 
     def get(self, *args, **kwargs) -> Optional[Task]:
+        """Get a single Task
+
+        Parameters:
+            *args (str): (optional) task type to retrieve
+
+        Keyword Arguments:
+            name (str): task type to retrieve
+            serviceTaskType (str): task type to retrieve
+            q (str): see filter()
+        """
         try:
             name = str(args[0])
         except IndexError:
             name = None
 
+        # A known task type goes straight to its layout
+        name = name or kwargs.pop("name", None) or kwargs.pop("serviceTaskType", None)
+
         if not name:
             if kwargs:
                 filter_lookup = self.filter(**kwargs)
@@ -115,15 +139,7 @@ class Tasks(Endpoint):
                     return filter_lookup[0]
             return None
 
-        key = f"service/form/{name}"
-
-        req = Request(
-            base=self.url,
-            key=key,
-            session=self.session,
-        )
-
-        return self._response_loader(req.get(), name)
+        return self._response_loader(self.layout(name), name)
 
     def filter(self, *args, **kwargs) -> list[Task]:
         """Attempt to use the filter options. Really only a single query
@@ -138,7 +154,6 @@ class Tasks(Endpoint):
         if not kwargs:
             raise ValueError("filter must be passed kwargs. Perhaps use all() instead.")
 
-        tasks = []
         key = "service"
         filters = {"q": kwargs.get("q", ""), "includeCannotCreate": True}
 
@@ -149,11 +164,7 @@ class Tasks(Endpoint):
             session=self.session,
         ).get()
 
-        for st in resp:
-            layout = self.layout(st["serviceTaskType"])
-            tasks.append(self._response_loader(layout, st["serviceTaskType"]))
-
-        return tasks
+        return self._load_services(resp)
 
     def get_services(self, query: Optional[str] = None, include_cannot_create=False):
         """Retrieve a list of task services
@@ -179,12 +190,20 @@ class Tasks(Endpoint):
         return resp
 
     def layout(self, task: str) -> RequestResponse:
-        """Retrieve a task layout.
+        """Retrieve a task layout. Layouts are cached per task type,
+        use `cache_clear()` to force them to be retrieved again.
 
         Parameters:
             task (str):
         """
+        # Every caller gets its own copy to change
+        return copy.deepcopy(self._layout_cached(task))
 
+    def cache_clear(self) -> None:
+        """Clear the cached task layouts."""
+        self._layout_cached.cache_clear()
+
+    def _layout(self, task: str) -> RequestResponse:
         key = f"service/form/{task}"
 
         resp = Request(
@@ -193,4 +212,5 @@ class Tasks(Endpoint):
             session=self.session,
         ).get()
 
-        return resp
+        # Cached layouts share the same form keys over and over
+        return _intern_keys(resp)
@@ -1,5 +1,6 @@
 # Standard packages
 import logging
+from functools import cached_property
 
 # Local packages
 from firemon_api.core.app import App
@@ -17,18 +18,22 @@ class Workflow(Record):
 
     _ep_name = "workflow"
     _is_domain_url = True
-
-    def __init__(self, config: dict, app: App):
-        super().__init__(config, app)
-
-        self.tickets = Packets(self._app.api, self._app, config["id"])
-
-        self._no_no_keys = [
+    _no_no_keys = frozenset(
+        {
             "createdBy",
             "createdDate",
             "lastModifiedBy",
             "lastModifiedDate",
-        ]
+        }
+    )
+
+    def __init__(self, config: dict, app: App):
+        super().__init__(config, app)
+
+    @cached_property
+    def tickets(self) -> Packets:
+        """Packets (tickets) of this workflow, built on first use"""
+        return Packets(self._app.api, self._app, self._config["id"])
 
     def save(self) -> RequestResponse:
         if self.id:
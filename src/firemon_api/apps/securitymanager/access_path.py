@@ -1,6 +1,5 @@
 # Standard packages
 import logging
-import copy
 
 from typing import Optional
 
@@ -15,15 +14,104 @@ log = logging.getLogger(__name__)
 class AccessPathEvent(BaseRecord):
     """Access Path Event"""
 
-    _ep_name = "apa"
+    # No `_ep_name`: every event shares the url of its AccessPath so there
+    # is nothing for `BaseRecord` to build per event.
+    _ep_name = None
     _is_domain_url = True
 
     def __init__(self, config: dict, app: App, url: str):
         self._url = url
+        # `BaseRecord` skips `_parse_config` for an empty config
+        self._parsed = False
         super().__init__(config, app)
 
-    def _url_create(self):
-        return self._url
+    def _parse_config(self, config: dict) -> None:
+        # Most events in a path are never looked at. Wait until an
+        # attribute is asked for before building them out.
+        self._parsed = False
+
+    def _parse_event(self) -> None:
+        self._parsed = True
+        super()._parse_config(self._config)
+
+    def __getattr__(self, name):
+        # Only reached when `name` is not already set
+        if name.startswith("_") or self.__dict__.get("_parsed", True):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+        self._parse_event()
+        return getattr(self, name)
+
+    def __iter__(self):
+        if not self._parsed:
+            self._parse_event()
+        return super().__iter__()
+
+
+def _parse_paths(record: BaseRecord, starting_event: dict) -> list[dict]:
+    """Walk the APA events from `starting_event` and split them into paths.
+
+    Uses an explicit stack rather than recursion so deep access paths do
+    not run into the recursion limit. Every branch repeats the events
+    before it, so each event is only turned into an `AccessPathEvent` once
+    and shared between the paths that pass through it.
+
+    Parameters:
+        record (BaseRecord): the AccessPath owning the events
+        starting_event (dict): the "startingEvent" json
+
+    Returns:
+        list[dict]: paths in the order they were found
+    """
+    paths = []
+    path = {
+        "branch": starting_event["id"],
+        "branch_parent": None,
+        "event_ordinal": 0,
+        "packet_result": {},
+        "events": [],
+    }
+    stack = [(starting_event, path)]
+    while stack:
+        event, path = stack.pop()
+        path_events = path["events"]
+        # Follow a chain without branches here rather than going back
+        # through the stack for every event on it.
+        while True:
+            path_events.append(AccessPathEvent(event, record, record._url))
+
+            next_events = event.get("nextEvents")
+            if not next_events or len(next_events) > 1:
+                break
+            event = next_events[0]
+
+        if not next_events:
+            path["packet_result"] = event.get("ipPacketResult", {})
+            paths.append(path)
+        else:
+            # This seems like a bug in APA needing to process in
+            # reverse to mimic policy order match. Pushing in order
+            # means the stack pops them in reverse.
+            last = len(next_events) - 1
+            for i, evnt in enumerate(next_events):
+                if i == last:
+                    # Popped first and every other branch has already
+                    # copied `path` so it can carry on with it.
+                    stack.append((evnt, path))
+                    continue
+                # The events list is append-only and events are never
+                # modified once parsed, so a shallow copy is safe.
+                branch_path = {
+                    "branch": evnt["id"],
+                    "branch_parent": event["id"],
+                    "event_ordinal": len(path_events),
+                    "packet_result": {},
+                    "events": list(path_events),
+                }
+                stack.append((evnt, branch_path))
+
+    return paths
 
 
 class AccessPath(BaseRecord):
@@ -64,36 +152,7 @@ class AccessPath(BaseRecord):
         Returns:
             None
         """
-        se = self._config["startingEvent"].copy()
-        path = {
-            "branch": se["id"],
-            "branch_parent": None,
-            "event_ordinal": 0,
-            "packet_result": {},
-            "events": [],
-        }
-        self._parse_event(se, path)
-
-    def _parse_event(self, event: dict, path: dict) -> None:
-        path["events"].append(AccessPathEvent(event, self, self._url))
-
-        if event.get("nextEvents"):
-            if len(event["nextEvents"]) > 1:
-                for i, evnt in enumerate(event["nextEvents"][::-1]):
-                    # This seems like a bug in APA needing to process in
-                    # reverse to mimic policy order match.
-                    # branch_path = path.copy()  # can this be done with shallow copy?
-                    branch_path = copy.deepcopy(path)
-                    if i > 0:
-                        branch_path["branch_parent"] = event["id"]
-                        branch_path["branch"] = evnt["id"]
-                        branch_path["event_ordinal"] = len(branch_path["events"])
-                    self._parse_event(evnt, branch_path)
-            else:
-                self._parse_event(event["nextEvents"][0], path)
-        else:
-            path["packet_result"] = event.get("ipPacketResult", {})
-            self.paths.append(path)
+        self.paths = _parse_paths(self, self._config["startingEvent"])
 
     def get_graphml(self) -> RequestResponse:
         """Get graphml data
@@ -160,36 +219,7 @@ class NetworkAccessPath(BaseRecord):
         Returns:
             None
         """
-        se = self._config["startingEvent"].copy()
-        path = {
-            "branch": se["id"],
-            "branch_parent": None,
-            "event_ordinal": 0,
-            "packet_result": {},
-            "events": [],
-        }
-        self._parse_event(se, path)
-
-    def _parse_event(self, event: dict, path: dict) -> None:
-        path["events"].append(AccessPathEvent(event, self, self._url))
-
-        if event.get("nextEvents"):
-            if len(event["nextEvents"]) > 1:
-                for i, evnt in enumerate(event["nextEvents"][::-1]):
-                    # This seems like a bug in APA needing to process in
-                    # reverse to mimic policy order match.
-                    # branch_path = path.copy()  # can this be done with shallow copy?
-                    branch_path = copy.deepcopy(path)
-                    if i > 0:
-                        branch_path["branch_parent"] = event["id"]
-                        branch_path["branch"] = evnt["id"]
-                        branch_path["event_ordinal"] = len(branch_path["events"])
-                    self._parse_event(evnt, branch_path)
-            else:
-                self._parse_event(event["nextEvents"][0], path)
-        else:
-            path["packet_result"] = event.get("ipPacketResult", {})
-            self.paths.append(path)
+        self.paths = _parse_paths(self, self._config["startingEvent"])
 
     def __str__(self):
         return str("NetworkAccessPath")
@@ -4,7 +4,7 @@ import logging
 # Local packages
 from firemon_api.core.app import App
 from firemon_api.core.api import FiremonAPI
-from firemon_api.core.endpoint import Endpoint
+from firemon_api.core.endpoint import CachedEndpoint
 from firemon_api.core.response import Record
 
 log = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ class CentralSyslogConfig(Record):
         super().__init__(config, app)
 
 
-class CentralSyslogConfigs(Endpoint):
+class CentralSyslogConfigs(CachedEndpoint):
     """Central Syslog Configs Endpoint
 
     Parameters:
@@ -47,15 +47,7 @@ class CentralSyslogConfigs(Endpoint):
         Returns:
             list[CentralSyslogConfig]
         """
-        csc_all = self.all()
         if not kwargs:
             raise ValueError("filter must have kwargs")
 
-        return [csc for csc in csc_all if kwargs.items() <= dict(csc).items()]
-
-    def count(self) -> int:
-        """
-        Returns:
-            int
-        """
-        return len(self.all())
+        return self._filter_cached(None, kwargs)
@@ -23,13 +23,12 @@ class CentralSyslog(Record):
     _ep_name = "central-syslog"
     _is_domain_url = True
     centralSyslogConfig = CentralSyslogConfig
+    # not needed for `serialize` update using ep function
+    _no_no_keys = frozenset({"centralSyslogConfig"})
 
     def __init__(self, config: dict, app: App):
         super().__init__(config, app)
 
-        # not needed for `serialize` update using ep function
-        self._no_no_keys = ["centralSyslogConfig"]
-
     def device_set(self, id: int) -> RequestResponse:
         """Set a device to this Central Syslog
 
@@ -47,6 +46,17 @@ class CentralSyslog(Record):
         )
         return req.post()
 
+    def device_set_many(self, ids: list[int]) -> dict[int, bool]:
+        """Set several devices to this Central Syslog.
+
+        Parameters:
+            ids (list[int]): device ids to assign
+
+        Returns:
+            dict: device id -> True if set, False if the server refused it
+        """
+        return self._device_many(self.device_set, ids)
+
     def device_unset(self, id: int) -> RequestResponse:
         """Unset a device to this Central Syslog
 
@@ -64,6 +74,17 @@ class CentralSyslog(Record):
         )
         return req.delete()
 
+    def device_unset_many(self, ids: list[int]) -> dict[int, bool]:
+        """Unset several devices from this Central Syslog.
+
+        Parameters:
+            ids (list[int]): device ids to unset
+
+        Returns:
+            dict: device id -> True if unset, False if the server refused it
+        """
+        return self._device_many(self.device_unset, ids)
+
     def csc_set(self, id: int) -> RequestResponse:
         """Set a Central Syslog Config to this CS
 
@@ -1,10 +1,11 @@
 # Standard packages
 import logging
+from typing import Optional
 
 # Local packages
 from firemon_api.core.app import App
 from firemon_api.core.api import FiremonAPI
-from firemon_api.core.endpoint import Endpoint
+from firemon_api.core.endpoint import CachedEndpoint
 from firemon_api.core.response import Record
 from firemon_api.core.query import Request, RequestResponse
 
@@ -41,6 +42,15 @@ class CollectionConfig(Record):
     """
 
     _ep_name = "collectionconfig"
+    _no_no_keys = frozenset(
+        {
+            "index",
+            "createdBy",
+            "createdDate",
+            "lastModifiedBy",
+            "lastModifiedDate",
+        }
+    )
 
     def __init__(self, config: dict, app: App):
         super().__init__(
@@ -48,20 +58,13 @@ class CollectionConfig(Record):
             app,
         )
 
-        self._no_no_keys = [
-            "index",
-            "createdBy",
-            "createdDate",
-            "lastModifiedBy",
-            "lastModifiedDate",
-        ]
-
     def devicepack_set(self) -> RequestResponse:
         """Set CollectionConfig for Device Pack assignment.
 
         Returns:
             bool
         """
+        self._endpoint_cache_clear()
         key = f"devicepack/{self.devicePackId}/assignment/{self.id}"
         req = Request(
             base=self._ep_url,
@@ -74,6 +77,7 @@ class CollectionConfig(Record):
         """Unset CollectionConfig for Device Pack assignment.
         Effectively sets back to 'default'
         """
+        self._endpoint_cache_clear()
         key = f"devicepack/{self.devicePackId}/assignment"
         req = Request(
             base=self._ep_url,
@@ -94,6 +98,7 @@ class CollectionConfig(Record):
         Return:
             bool: True if device set
         """
+        self._endpoint_cache_clear()
         key = f"device/{id}/assignment/{self.id}"
         req = Request(
             base=self._ep_url,
@@ -102,6 +107,17 @@ class CollectionConfig(Record):
         )
         return req.put()
 
+    def device_set_many(self, ids: list[int]) -> dict[int, bool]:
+        """Set several devices for this CollectionConfig.
+
+        Parameters:
+            ids (list[int]): device ids to assign
+
+        Return:
+            dict: device id -> True if set, False if the server refused it
+        """
+        return self._device_many(self.device_set, ids)
+
     def device_unset(self, id: int) -> RequestResponse:
         """Unset a device from CollectionConfig
 
@@ -111,6 +127,7 @@ class CollectionConfig(Record):
         Return:
             bool: True if device unset
         """
+        self._endpoint_cache_clear()
         key = f"device/{id}/assignment"
         req = Request(
             base=self._ep_url,
@@ -119,8 +136,19 @@ class CollectionConfig(Record):
         )
         return req.delete()
 
+    def device_unset_many(self, ids: list[int]) -> dict[int, bool]:
+        """Unset several devices from this CollectionConfig.
+
+        Parameters:
+            ids (list[int]): device ids to unset
+
+        Return:
+            dict: device id -> True if unset, False if the server refused it
+        """
+        return self._device_many(self.device_unset, ids)
+
 
-class CollectionConfigs(Endpoint):
+class CollectionConfigs(CachedEndpoint):
     """Collection Configs Endpoint
 
     Parameters:
@@ -141,6 +169,7 @@ class CollectionConfigs(Endpoint):
     """
 
     ep_name = "collectionconfig"
+    _page_size = 500
 
     def __init__(
         self,
@@ -155,23 +184,29 @@ class CollectionConfigs(Endpoint):
         self._device_id = device_id
         self._devicepack_id = devicepack_id
 
-    def all(self) -> list[CollectionConfig]:
-        """Get all `Record`
-
-        Returns:
-            list[CollectionConfig]: a list of CollectionConfig(object)
-        """
-        filters = None
+    def _all_filters(self) -> Optional[dict]:
         if self.device_id:
-            filters = {"devicePackId": self.devicepack_id}
+            return {"devicePackId": self.devicepack_id}
+        return None
 
-        req = Request(
-            base=self.url,
-            filters=filters,
-            session=self.api.session,
-        )
+    def get(self, *args, **kwargs) -> Optional[CollectionConfig]:
+        """Get a single CollectionConfig. An id is looked up in a recent
+        `all()` first and only requested from the server if not found.
 
-        return [self._response_loader(i) for i in req.get()]
+        Parameters:
+            *args (int): (optional) id to retrieve
+            **kwargs (str): (optional) see filter()
+
+        Return:
+            CollectionConfig
+        """
+        if args:
+            id = str(args[0])
+            for cc in self._cached(self._all_filters()) or ():
+                if str(cc.get("id")) == id:
+                    return self._response_loader(cc)
+
+        return super().get(*args, **kwargs)
 
     def filter(self, *args, **kwargs) -> list[CollectionConfig]:
         """Retrieve a filterd list of CollectionConfigs
@@ -195,21 +230,41 @@ class CollectionConfigs(Endpoint):
             >>> fm.sm.cc.filter(activatedForDevicePack=True)
             [4, 36, 18, 38, 24, 13, 8, 30, ...]
         """
-        cc_all = self.all()
         if args:
             kwargs.update({"name": args[0]})
 
         if not kwargs:
             raise ValueError("filter must have kwargs")
 
-        return [cc for cc in cc_all if kwargs.items() <= dict(cc).items()]
+        # The server only filters on `devicePackId`. Use it to narrow what
+        # is fetched and match everything else here. A device scoped
+        # endpoint keeps its own device pack.
+        filters = self._all_filters()
+        if filters is None and "devicePackId" in kwargs:
+            filters = {"devicePackId": kwargs["devicePackId"]}
+
+        return self._filter_cached(filters, kwargs)
 
     def count(self) -> int:
         """
         Returns:
             int
         """
-        return len(self.all())
+        filters = self._all_filters()
+        resp = self._cached(filters)
+        if resp is not None:
+            return len(resp)
+
+        # Only the `total` of a single item page is needed
+        try:
+            return Request(
+                base=self.url,
+                filters={**(filters or {}), "pageSize": 1},
+                session=self.api.session,
+            ).get_count()
+        except (KeyError, TypeError):
+            # Not a paged response after all
+            return len(self._get(filters))
 
     @property
     def device_id(self):
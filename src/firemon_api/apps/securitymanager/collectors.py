@@ -8,6 +8,7 @@ from firemon_api.core.api import FiremonAPI
 from firemon_api.core.endpoint import Endpoint
 from firemon_api.core.response import Record
 from firemon_api.core.query import Request, RequestResponse
+from firemon_api.core.utils import _pool_map
 
 from firemon_api.apps.structure.collector import UsageObjects, RuleUsages, Usage
 from .devices import Device
@@ -43,18 +44,14 @@ class Collector(Record):
         return req.get()
 
     def devices(self) -> list[Device]:
-        """Get all devices assigned to collector
+        """Get all devices assigned to collector. Repeat calls within
+        `_cache_ttl` seconds are answered from memory, use `cache_clear()`
+        to force them to be retrieved again.
 
         Returns:
             list[Device]
         """
-        key = "device"
-        req = Request(
-            base=self._url,
-            key=key,
-            session=self._session,
-        )
-        return [Device(config, self._app) for config in req.get()]
+        return [Device(config, self._app) for config in self._get_cached("device")]
 
 
 class Collectors(Endpoint):
@@ -69,6 +66,7 @@ class Collectors(Endpoint):
     """
 
     ep_name = "collector"
+    _page_size = 1000
 
     def __init__(self, api: FiremonAPI, app: App, record=Collector):
         super().__init__(api, app, record=record)
@@ -76,9 +74,21 @@ class Collectors(Endpoint):
     def _make_filters(self, values):
         # Only a 'search' for a single value. Take all key-values
         # and use the first key's value for search query
-        filters = {"search": values[next(iter(values))]}
+        filters = {"search": next(iter(values.values()))}
         return filters
 
+    def devices_many(self, collectors: list[Collector]) -> list[list[Device]]:
+        """Get the devices of several Collectors. Each Collector is its own
+        request so they are sent side by side instead of one after the other.
+
+        Parameters:
+            collectors (list[Collector]): Collectors from `all()` or `filter()`
+
+        Returns:
+            list: `Collector.devices()` results in the same order as `collectors`
+        """
+        return _pool_map(lambda c: c.devices(), collectors)
+
     def save_usage(
         self, config: Usage, async_aggregation: bool = True
     ) -> RequestResponse:
@@ -101,6 +111,38 @@ class Collectors(Endpoint):
 
         return req.post(json=config)
 
+    def save_usage_many(
+        self,
+        usages: list[Usage],
+        async_aggregation: bool = True,
+        batch_size: int = 1000,
+    ) -> list[RequestResponse]:
+        """Save several usages in as few requests as possible. The
+        `ruleUsages` of usages sharing an `endDate` are sent together,
+        up to `batch_size` rule usages per request.
+
+        Parameters:
+            usages (list[Usage]): usage data to save
+            async_aggregation (bool): see `save_usage()`
+            batch_size (int): most rule usages sent in one request
+
+        Return:
+            list: `save_usage()` results, one per request sent
+        """
+        by_date = {}
+        for usage in usages:
+            by_date.setdefault(usage["endDate"], []).extend(usage["ruleUsages"])
+
+        resp = []
+        for end_date, rule_usages in by_date.items():
+            for i in range(0, len(rule_usages), batch_size):
+                config = {
+                    "endDate": end_date,
+                    "ruleUsages": rule_usages[i : i + batch_size],
+                }
+                resp.append(self.save_usage(config, async_aggregation))
+        return resp
+
 
 class CollectorGroup(Record):
     """Represents the Collector Group
@@ -123,6 +165,7 @@ class CollectorGroup(Record):
         Parameters:
             cid (int): Collector ID
         """
+        self.cache_clear()
         key = f"member/{cid}"
         req = Request(
             base=self._url,
@@ -147,6 +190,7 @@ class CollectorGroup(Record):
         Returns:
             bool
         """
+        self.cache_clear()
         key = f"member/{id}"
         req = Request(
             base=self._url,
@@ -156,18 +200,14 @@ class CollectorGroup(Record):
         return req.put()
 
     def assigned(self) -> RequestResponse:
-        """Get assigned devices
+        """Get assigned devices. Repeat calls within `_cache_ttl` seconds
+        are answered from memory, use `cache_clear()` to force them to be
+        retrieved again.
 
         Returns:
             dict
         """
-        key = f"assigned"
-        req = Request(
-            base=self._url,
-            key=key,
-            session=self._session,
-        )
-        return req.get()
+        return self._get_cached("assigned")
 
 
 class CollectorGroups(Endpoint):
@@ -182,6 +222,7 @@ class CollectorGroups(Endpoint):
     """
 
     ep_name = "collector/group"
+    _page_size = 1000
 
     def __init__(self, api: FiremonAPI, app: App, record=CollectorGroup):
         super().__init__(api, app, record=record)
@@ -189,7 +230,7 @@ class CollectorGroups(Endpoint):
     def _make_filters(self, values):
         # Only a 'search' for a single value. Take all key-values
         # and use the first key's value for search query
-        filters = {"search": values[next(iter(values))]}
+        filters = {"search": next(iter(values.values()))}
         return filters
 
     def count(self):
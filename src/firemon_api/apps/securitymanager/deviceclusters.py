@@ -6,7 +6,7 @@ from firemon_api.core.app import App
 from firemon_api.core.api import FiremonAPI
 from firemon_api.core.endpoint import Endpoint
 from firemon_api.core.response import Record
-from firemon_api.core.query import Request
+from firemon_api.core.utils import _pool_map
 
 from .devices import Device
 
@@ -34,18 +34,14 @@ class DeviceCluster(Record):
         super().__init__(config, app)
 
     def devices(self) -> list[Device]:
-        """Get all devices assigned to cluster
+        """Get all devices assigned to cluster. Repeat calls within
+        `_cache_ttl` seconds are answered from memory, use `cache_clear()`
+        to force them to be retrieved again.
 
         Returns:
             list[Device]
         """
-        key = "device"
-        req = Request(
-            base=self._url,
-            key=key,
-            session=self._session,
-        )
-        return [Device(config, self._app) for config in req.get()]
+        return [Device(config, self._app) for config in self._get_cached("device")]
 
 
 class DeviceClusters(Endpoint):
@@ -69,3 +65,15 @@ class DeviceClusters(Endpoint):
 
     def __init__(self, api: FiremonAPI, app: App, record=DeviceCluster):
         super().__init__(api, app, record=record)
+
+    def devices_many(self, clusters: list[DeviceCluster]) -> list[list[Device]]:
+        """Get the devices of several Device Clusters, side by side like
+        `Collectors.devices_many()`.
+
+        Parameters:
+            clusters (list[DeviceCluster]): clusters from `all()` or `filter()`
+
+        Returns:
+            list: `DeviceCluster.devices()` results in the same order as `clusters`
+        """
+        return _pool_map(lambda c: c.devices(), clusters)
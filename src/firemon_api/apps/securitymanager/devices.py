@@ -78,17 +78,18 @@ class Device(Record):
     _is_domain_url = True
     extendedSettingsJson = JsonField
     devicePack = DevicePack
-
-    def __init__(self, config: dict, app: App):
-        super().__init__(config, app)
-
-        self._no_no_keys = [
+    _no_no_keys = frozenset(
+        {
             "securityConcernIndex",
             "gpcComputeDate",
             "gpcDirtyDate",
             "gpcImplementDate",
             "gpcStatus",
-        ]
+        }
+    )
+
+    def __init__(self, config: dict, app: App):
+        super().__init__(config, app)
 
         # Add attributes to Record() so we can get more info
         self.collectionconfigs = CollectionConfigs(
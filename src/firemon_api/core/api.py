@@ -8,6 +8,7 @@ from typing import Optional
 
 # Third-Party packages
 import requests  # performing web requests
+from urllib3.util.request import ACCEPT_ENCODING
 
 # Local packages
 import firemon_api
@@ -90,7 +91,8 @@ class FiremonAPI(object):
         # self.session.auth = (self.username, self.password)  # Basic auth is used
         self.default_headers = {
             "User-Agent": f"py-firemon-api/{firemon_api.__version__}",
-            "Accept-Encoding": "gzip, deflate",
+            # gzip and deflate, plus br/zstd when a decoder is installed
+            "Accept-Encoding": ACCEPT_ENCODING,
             "Accept": "*/*",
             "Connection": "keep-alive",
         }
@@ -32,10 +32,11 @@ class DynamicApi(object):
                 setattr(self, oid, _method)
 
     def _make_method(self, path: str, verb: str) -> Callable:
+        # Strip once here rather than on every call
+        p = path.lstrip("/")
         if verb == "get":
 
             def _method(filters=None, add_params=None, **kwargs):
-                p = path.lstrip("/")
                 key = p.format(**kwargs)
                 filters = filters
                 req = Request(
@@ -51,7 +52,6 @@ class DynamicApi(object):
         elif verb == "put":
 
             def _method(filters=None, data=None, **kwargs):
-                p = path.lstrip("/")
                 key = p.format(**kwargs)
                 filters = filters
                 req = Request(
@@ -67,7 +67,6 @@ class DynamicApi(object):
         elif verb == "post":
 
             def _method(filters=None, data=None, files=None, **kwargs):
-                p = path.lstrip("/")
                 key = p.format(**kwargs)
                 filters = filters
                 req = Request(
@@ -83,7 +82,6 @@ class DynamicApi(object):
         elif verb == "delete":
 
             def _method(filters=None, **kwargs):
-                p = path.lstrip("/")
                 key = p.format(**kwargs)
                 filters = filters
                 req = Request(
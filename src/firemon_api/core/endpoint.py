@@ -1,11 +1,13 @@
 # Standard modules
+import copy
+import time
 from typing import Optional, Union
 
 # Local packages
 from firemon_api.core.api import FiremonAPI
 from firemon_api.core.app import App
-from firemon_api.core.query import Request
-from firemon_api.core.response import BaseRecord, Record, JsonField
+from firemon_api.core.query import Request, RequestError
+from firemon_api.core.response import BaseRecord, Record, JsonField, _MISS
 
 
 class BaseEndpoint(object):
@@ -57,6 +59,10 @@ class Endpoint(BaseEndpoint):
         record (obj): optional `Record` to use
     """
 
+    # Results per page when getting lists. Child classes can ask for more,
+    # if the server refuses it drops back to 100.
+    _page_size = 100
+
     def __init__(
         self,
         api: FiremonAPI,
@@ -85,6 +91,15 @@ class Endpoint(BaseEndpoint):
         filters = {"filter": l}
         return filters
 
+    def _paged_get(self, req: Request) -> list:
+        try:
+            return req.get(add_params={"pageSize": self._page_size})
+        except RequestError as e:
+            if self._page_size <= 100 or e.req.status_code != 400:
+                raise
+            self._page_size = 100
+            return req.get(add_params={"pageSize": self._page_size})
+
     def all(self) -> list[Record]:
         """Get all `Record`"""
         req = Request(
@@ -93,7 +108,7 @@ class Endpoint(BaseEndpoint):
             session=self.api.session,
         )
 
-        return [self._response_loader(i) for i in req.get()]
+        return [self._response_loader(i) for i in self._paged_get(req)]
 
     def get(self, *args, **kwargs) -> Record:
         """Get single Record
@@ -165,7 +180,7 @@ class Endpoint(BaseEndpoint):
             session=self.api.session,
         )
 
-        ret = [self._response_loader(i) for i in req.get()]
+        ret = [self._response_loader(i) for i in self._paged_get(req)]
         return ret
 
     def create(self, *args, **kwargs) -> Record:
@@ -213,6 +228,118 @@ class Endpoint(BaseEndpoint):
         return f"{self.url}"
 
 
+class CachedEndpoint(Endpoint):
+    """An Endpoint that answers repeat queries from memory for
+    `_cache_ttl` seconds. The json is kept rather than records, and every
+    call hands out its own records to change. Records loaded here clear
+    the cache when they are saved or deleted.
+
+    Parameters:
+        api (obj): FiremonAPI()
+        app (obj): App()
+        record (obj): optional `Record` to use
+    """
+
+    # Seconds that the same query is answered from memory
+    _cache_ttl = 5.0
+
+    def __init__(
+        self,
+        api: FiremonAPI,
+        app: App,
+        record: Optional[Union[Record, JsonField]] = None,
+    ):
+        super().__init__(api, app, record=record)
+        self._cache = {}
+
+    def _cache_key(self, filters: Optional[dict]) -> Optional[frozenset]:
+        return frozenset(filters.items()) if filters else None
+
+    def _cached(self, filters: Optional[dict] = None) -> Optional[list[dict]]:
+        hit = self._cache.get(self._cache_key(filters))
+        if hit is None or time.monotonic() - hit[0] >= self._cache_ttl:
+            return None
+        return hit[1]
+
+    def _get(self, filters: Optional[dict] = None) -> list[dict]:
+        resp = self._cached(filters)
+        if resp is None:
+            req = Request(
+                base=self.url,
+                key=self._ep["all"],
+                filters=dict(filters) if filters else None,
+                session=self.api.session,
+            )
+            resp = self._paged_get(req)
+            self._cache[self._cache_key(filters)] = (time.monotonic(), resp, {})
+        return resp
+
+    def _index_for(self, filters: Optional[dict], key: str) -> Optional[dict]:
+        # value -> json for one key of a cached query, built on first use.
+        # Only plain values are indexed, None means scan instead.
+        _, resp, indexes = self._cache[self._cache_key(filters)]
+        if key not in indexes:
+            index = {}
+            for values in resp:
+                value = values.get(key, _MISS)
+                if isinstance(value, (list, dict)):
+                    index = None
+                    break
+                index.setdefault(value, []).append(values)
+            indexes[key] = index
+        return indexes[key]
+
+    def _all_filters(self) -> Optional[dict]:
+        # Server side filters that `all()` always sends
+        return None
+
+    def _filter_cached(self, filters: Optional[dict], kwargs: dict) -> list[Record]:
+        # Start from the fewest entries any indexed key allows, then match
+        # against the json so records are only built for matches
+        candidates = self._get(filters)
+        wanted = tuple(kwargs.items())
+        for k, v in wanted:
+            if isinstance(v, (list, dict)):
+                continue
+            index = self._index_for(filters, k)
+            if index is None:
+                continue
+            found = index.get(v)
+            if not found:
+                # Nothing has this value so nothing can match
+                return []
+            if len(found) < len(candidates):
+                candidates = found
+
+        return [
+            self._response_loader(values)
+            for values in candidates
+            if all(values.get(k, _MISS) == v for k, v in wanted)
+        ]
+
+    def _response_loader(self, values: dict) -> Record:
+        # The cached json is never handed out, only copies of it
+        record = super()._response_loader(copy.deepcopy(values))
+        record._endpoint = self
+        return record
+
+    def cache_clear(self) -> None:
+        """Forget the results of `all()`, `filter()` and `count()`."""
+        self._cache.clear()
+
+    def create(self, *args, **kwargs) -> Record:
+        self.cache_clear()
+        return super().create(*args, **kwargs)
+
+    def all(self) -> list[Record]:
+        """Get all `Record`"""
+        return [self._response_loader(i) for i in self._get(self._all_filters())]
+
+    def count(self) -> int:
+        """Returns the count of objects available."""
+        return len(self._get(self._all_filters()))
+
+
 class EndpointCpl(BaseEndpoint):
     """Represent actions available on Control Panel
 
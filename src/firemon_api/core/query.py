@@ -19,10 +19,22 @@ from tenacity import (
 
 from firemon_api.core.errors import FiremonApiError
 
+# optional faster json decoding
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 log = logging.getLogger(__name__)
 
 RequestResponse = Union[bool, dict, str, bytes]
 
+# Default headers per verb. `requests` merges these into a new dict for
+# every request so the same dicts are shared by every call.
+_MULTIPART_HEADERS = {"Content-Type": "multipart/form-data"}
+_JSON_HEADERS = {"Content-Type": "application/json;"}
+_ACCEPT_HEADERS = {"accept": "application/json;"}
+
 
 def url_param_builder(param_dict: dict) -> str:
     """Builds url parameters
@@ -33,7 +45,7 @@ def url_param_builder(param_dict: dict) -> str:
 
 def calc_pages(pageSize: int, total: int) -> int:
     """Calculate number of pages required for full results set."""
-    return int(total / pageSize) + (pageSize % total > 0)
+    return (total + pageSize - 1) // pageSize
 
 
 class RequestError(FiremonApiError):
@@ -136,11 +148,11 @@ class Request(object):
             headers = self.headers
         else:
             if verb in ("post") and files:
-                headers = {"Content-Type": "multipart/form-data"}
+                headers = _MULTIPART_HEADERS
             elif verb in ("post", "put"):
-                headers = {"Content-Type": "application/json;"}
+                headers = _JSON_HEADERS
             else:
-                headers = {"accept": "application/json;"}
+                headers = _ACCEPT_HEADERS
 
         params = {}
         if not url_override:
@@ -168,9 +180,10 @@ class Request(object):
                 raise RequestError(resp)
         elif resp.ok:
             try:
-                return resp.json()
-            except JSONDecodeError:
-                # Assuming an empty body or data download
+                return json_loads(resp.content)
+            except (JSONDecodeError, UnicodeDecodeError):
+                # Assuming an empty body or data download. Without orjson a
+                # binary body (zip) fails decoding before it fails as json.
                 if resp.content:
                     return resp.content
                 else:
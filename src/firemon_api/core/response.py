@@ -1,11 +1,12 @@
 import copy
 import logging
+import time
 
 from typing import Union, Any
 
 from firemon_api.core.app import App
-from firemon_api.core.query import Request
-from firemon_api.core.utils import Hashabledict
+from firemon_api.core.query import Request, RequestError, RequestResponse
+from firemon_api.core.utils import Hashabledict, _pool_map
 
 
 log = logging.getLogger(__name__)
@@ -243,19 +244,57 @@ class Record(BaseRecord):
         ...}
     """
 
+    # Keys that might break `save` or `update`. Child classes override
+    # this at the class level.
+    _no_no_keys = frozenset()
+    # Set by a `CachedEndpoint` so that changes made here clear its cache
+    _endpoint = None
+    # Seconds that `_get_cached()` answers from memory
+    _cache_ttl = 5.0
+
     def __init__(self, config: dict, app: App):
         super().__init__(config, app)
+        self._get_cache = {}
+
+    def _get_cached(self, key: str) -> RequestResponse:
+        # GET `key` below this record, answered from memory for
+        # `_cache_ttl` seconds. Callers always get their own copy.
+        hit = self._get_cache.get(key)
+        if hit is None or time.monotonic() - hit[0] >= self._cache_ttl:
+            req = Request(
+                base=self._url,
+                key=key,
+                session=self._session,
+            )
+            hit = self._get_cache[key] = (time.monotonic(), req.get())
+        return copy.deepcopy(hit[1])
+
+    def cache_clear(self) -> None:
+        """Forget the responses kept for `devices()` and similar calls."""
+        self._get_cache.clear()
+
+    def _endpoint_cache_clear(self) -> None:
+        if self._endpoint is not None:
+            self._endpoint.cache_clear()
+
+    def _device_many(self, func, ids: list[int]) -> dict[int, bool]:
+        # Call `func` (i.e. `device_set`) for every id. A refused id must
+        # not hide which of the others were applied.
+        def call(id):
+            try:
+                func(id)
+            except RequestError as e:
+                log.warning(f"Device {id}: {e}")
+                return False
+            return True
 
-        self._no_no_keys = []
+        return dict(zip(ids, _pool_map(call, ids)))
 
     def _clean_no_no(self, d: dict) -> dict:
         # remove no_no_keys from a dict. A list of keys for a Record
         # that might break if trying to `save` or `update`
-        for k in self._no_no_keys:
-            try:
-                d.pop(k)
-            except KeyError:
-                continue
+        for k in d.keys() & self._no_no_keys:
+            del d[k]
         return d
 
     def attr_set(self, k: str, v: Union[str, list, dict]) -> None:
@@ -317,6 +356,7 @@ class Record(BaseRecord):
             >>>
 
         """
+        self._endpoint_cache_clear()
         if self.id:
             diff = self._diff()
             if diff:
@@ -371,6 +411,7 @@ class Record(BaseRecord):
             True
 
         """
+        self._endpoint_cache_clear()
         req = Request(
             base=self._url or self._app.ep_url,
             key=self.id if not self._url else None,
@@ -389,3 +430,6 @@ def get_return(lookup: Any, return_fields=None) -> Any:
         return str(lookup)
     else:
         return lookup
+
+
+_MISS = object()
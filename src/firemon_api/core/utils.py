@@ -1,13 +1,18 @@
 # Standard packages
 # import functools
 # from distutils.version import StrictVersion
-from typing import Generator
+import concurrent.futures as cf
+import sys
+from typing import Any, Callable, Generator
 
 
 def _find_dicts_with_key(key: str, dictionary: dict) -> Generator[dict, None, None]:
     """
     Find all dictionaries that contain a key.
 
+    Walks with an explicit stack instead of recursing so deeply nested
+    json does not pay for a generator frame per level.
+
     Parameters:
         key (str): the key value to find.
         dictionary (dict): the dictionary hiding the keys to find.
@@ -15,18 +20,19 @@ def _find_dicts_with_key(key: str, dictionary: dict) -> Generator[dict, None, No
     Yield:
         dict: the dictionary containing the key
     """
-    if isinstance(dictionary, dict):
-        if key in dictionary.keys():
-            yield dictionary
-        for k, v in dictionary.items():
-            if isinstance(v, dict) or isinstance(v, list):
-                for response in _find_dicts_with_key(key, v):
-                    yield response
-    elif isinstance(dictionary, list):
-        for item in dictionary:
-            if isinstance(item, dict) or isinstance(item, list):
-                for response in _find_dicts_with_key(key, item):
-                    yield response
+    stack = [dictionary]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if key in node:
+                yield node
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            continue
+        # Push in reverse so results come out in document order
+        stack.extend(v for v in reversed(children) if isinstance(v, (dict, list)))
 
 
 def _build_dict(seq: list, key: str) -> dict:
@@ -43,6 +49,43 @@ def _build_dict(seq: list, key: str) -> dict:
     return dict((d[key], dict(d, index=index)) for (index, d) in enumerate(seq))
 
 
+def _intern_keys(obj: Any) -> Any:
+    """Intern all string keys of decoded json.
+
+    The json decoder only shares identical keys within a single response.
+    Interning lets long lived data from many responses share them too.
+
+    Parameters:
+        obj (Any): decoded json
+
+    Return:
+        Any: a copy of `obj` with interned dictionary keys
+    """
+    if isinstance(obj, dict):
+        return {
+            sys.intern(k) if isinstance(k, str) else k: _intern_keys(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_intern_keys(i) for i in obj]
+    return obj
+
+
+def _pool_map(func: Callable, items: list) -> list:
+    """Call `func` on every item with a few requests in flight at once,
+    for calls that have no bulk version on the server.
+
+    Parameters:
+        func (Callable): called with each item
+        items (list): the items
+
+    Return:
+        list: results in the same order as `items`
+    """
+    with cf.ThreadPoolExecutor(max_workers=4) as pool:
+        return list(pool.map(func, items))
+
+
 class Hashabledict(dict):
     def __hash__(self):
         return hash(frozenset(self))